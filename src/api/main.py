@@ -37,6 +37,7 @@ import os
 import mlflow
 
 from .pydantic_models import CustomerData, PredictionResponse
+from ..monitoring import DriftMonitor
 
 # === Load model ===
 MODEL_NAME = "credit_scoring_model"
@@ -51,6 +52,13 @@ with open(FEATURES_PATH, 'r') as f:
 
 model = mlflow.sklearn.load_model(f"models:/{MODEL_NAME}@{ALIAS}")
 
+# === Load drift monitor (reference profile is written by train.py) ===
+REFERENCE_PROFILE_PATH = os.path.join(
+    os.path.dirname(__file__), '../../data/processed/reference_profile.json')
+monitor = None
+if os.path.exists(REFERENCE_PROFILE_PATH):
+    monitor = DriftMonitor.from_file(REFERENCE_PROFILE_PATH)
+
 # === Create FastAPI app ===
 app = FastAPI()
 
@@ -59,6 +67,17 @@ app = FastAPI()
 def read_root():
     return {"message": "✅ Credit Scoring Model API is running!"}
 
+
+# === Drift and data-quality report for live traffic ===
+@app.get("/monitoring/drift")
+def drift_report():
+    if monitor is None:
+        return {"error": f"No reference profile found at"
+                         f" {REFERENCE_PROFILE_PATH}."
+                         " Run src/train.py to create it."}
+    return monitor.report()
+
+
 # === Prediction endpoint with preprocessing ===
 @app.post("/predict")
 def predict(data: CustomerData):
@@ -69,10 +88,16 @@ def predict(data: CustomerData):
     try:
         df['TransactionStartTime'] = pd.to_datetime(df['TransactionStartTime'])
     except Exception as e:
+        if monitor is not None:
+            monitor.observe_invalid_timestamp()
         return {"error": f"Invalid or missing TransactionStartTime. Please provide a valid ISO datetime string. Details: {str(e)}"}
 
     df['Hour'] = df['TransactionStartTime'].dt.hour
     df = df.drop(columns=['TransactionStartTime'])
+
+    # Record raw inputs before encoding/scaling
+    if monitor is not None:
+        monitor.observe(df.iloc[0].to_dict())
     
     # Apply one-hot encoding for categorical variables (placeholder)
     categorical_cols = ['CurrencyCode', 'ProviderId', 'ProductId', 'ProductCategory', 'ChannelId']
@@ -87,6 +112,8 @@ def predict(data: CustomerData):
 
     # Make prediction
     probability = model.predict_proba(df)[:, 1][0]
+    if monitor is not None:
+        monitor.observe_prediction(probability)
     label = "Has probability of default" if probability >= 0.5 else "Does not have probability of default"
     return {"result": label, "risk_probability": probability}
 
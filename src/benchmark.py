@@ -0,0 +1,131 @@
+# src/benchmark.py
+
+import pickle
+import threading
+import time
+
+import pandas as pd
+import psutil
+
+
+def _tree_memory(process: psutil.Process) -> int:
+    """
+    RSS of a process plus the USS of each of its children (e.g. joblib
+    workers), so library pages shared with the workers are counted once.
+    """
+    total = process.memory_info().rss
+    for child in process.children(recursive=True):
+        try:
+            total += child.memory_full_info().uss
+        except psutil.Error:
+            pass
+    return total
+
+
+def fit_with_profile(estimator, X: pd.DataFrame, y: pd.Series,
+                     interval: float = 0.05) -> dict:
+    """
+    Fit an estimator and return its wall-clock fit time and memory use:
+    - fit_memory_increase_mb: peak memory during the fit above the level
+      measured just before it (comparable across candidates)
+    - fit_peak_memory_mb: absolute peak of this process and its children
+    Memory is sampled from a background thread every `interval` seconds,
+    so the fit itself runs without allocation tracing.
+    """
+    process = psutil.Process()
+    baseline = peak = _tree_memory(process)
+    done = threading.Event()
+
+    def sample():
+        nonlocal peak
+        while not done.wait(interval):
+            peak = max(peak, _tree_memory(process))
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    start = time.perf_counter()
+    try:
+        estimator.fit(X, y)
+        fit_seconds = time.perf_counter() - start
+    finally:
+        done.set()
+        sampler.join()
+    peak = max(peak, _tree_memory(process))
+    return {
+        'fit_seconds': fit_seconds,
+        'fit_memory_increase_mb': (peak - baseline) / 1024 ** 2,
+        'fit_peak_memory_mb': peak / 1024 ** 2,
+    }
+
+
+def search_stage_times(search) -> dict:
+    """
+    Per-stage times of a fitted GridSearchCV, from its own timings:
+    - cv_fit_seconds / cv_score_seconds: summed over all candidates and folds
+    - refit_seconds: final fit of the best estimator on the full training set
+    """
+    results = search.cv_results_
+    n_splits = search.n_splits_
+    return {
+        'cv_fit_seconds': float(sum(results['mean_fit_time']) * n_splits),
+        'cv_score_seconds': float(sum(results['mean_score_time']) * n_splits),
+        'refit_seconds': float(search.refit_time_),
+    }
+
+
+def prediction_latency_ms(estimator, X: pd.DataFrame,
+                          repeats: int = 20) -> float:
+    """
+    Median predict_proba latency in milliseconds for the given input
+    (after one warm-up call).
+    """
+    estimator.predict_proba(X)
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        estimator.predict_proba(X)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+def serialized_size_bytes(estimator) -> int:
+    """
+    Size of the pickled estimator, as stored in the MLflow model artifact.
+    """
+    return len(pickle.dumps(estimator))
+
+
+def benchmark_model(estimator, X: pd.DataFrame, batch_size: int = 1000,
+                    repeats: int = 20) -> dict:
+    """
+    Serving-cost benchmark for a fitted estimator:
+    - Single-row and batch prediction latency (median, ms)
+    - Serialized model size (bytes)
+    """
+    single_row = X.iloc[[0]]
+    batch = X.sample(n=batch_size, replace=len(X) < batch_size,
+                     random_state=42)
+    return {
+        'predict_single_row_ms':
+            prediction_latency_ms(estimator, single_row, repeats),
+        f'predict_batch_{batch_size}_ms':
+            prediction_latency_ms(estimator, batch, repeats),
+        'model_size_bytes': serialized_size_bytes(estimator),
+    }
+
+
+def select_production_model(results: dict, latency_budget_ms: float):
+    """
+    Name of the model with the highest ROC-AUC among those whose single-row
+    prediction latency is within the budget, or None if no model qualifies.
+    `results` maps model name to a dict with 'roc_auc' and
+    'predict_single_row_ms'.
+    """
+    eligible = {
+        name: r for name, r in results.items()
+        if r['predict_single_row_ms'] <= latency_budget_ms
+    }
+    if not eligible:
+        return None
+    return max(eligible, key=lambda name: eligible[name]['roc_auc'])
@@ -0,0 +1,379 @@
+# src/monitoring.py
+
+import copy
+import json
+import math
+import threading
+from bisect import bisect_right
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+# Raw request fields tracked by the drift monitor
+# (Hour is derived from TransactionStartTime)
+NUMERIC_FEATURES = ['Amount', 'Value', 'PricingStrategy', 'Hour']
+CATEGORICAL_FEATURES = [
+    'ProviderId', 'ProductId', 'ProductCategory', 'ChannelId'
+]
+PREDICTION_NAME = 'risk_probability'
+
+OTHER_CATEGORY = '__other__'
+PROBABILITY_EDGES = [i / 10 for i in range(1, 10)]
+EPSILON = 1e-4
+INSUFFICIENT_DATA = 'insufficient_data'
+
+# Drift is measured over the most recent CHUNK_SIZE * N_CHUNKS observations
+# per feature
+CHUNK_SIZE = 1000
+N_CHUNKS = 10
+# Below this many observations in the window, PSI/KS are not reported
+MIN_COUNT = 100
+
+
+def _quantile_edges(series: pd.Series, n_bins: int) -> list:
+    """
+    Interior bin edges at the quantiles of a numerical Series
+    (duplicates removed).
+    """
+    quantiles = series.quantile(np.linspace(0, 1, n_bins + 1)[1:-1])
+    return sorted(set(float(q) for q in quantiles if not math.isnan(q)))
+
+
+def _numeric_profile(series: pd.Series, edges: list) -> dict:
+    """
+    Histogram counts of a Series over (-inf, e0), [e0, e1), ..., [ek, inf).
+    min/max are None when the Series has no non-missing values.
+    """
+    values = series.dropna().to_numpy(dtype=float)
+    idx = np.searchsorted(edges, values, side='right')
+    counts = np.bincount(idx, minlength=len(edges) + 1)
+    return {
+        'edges': edges,
+        'counts': counts.tolist(),
+        'min': float(values.min()) if len(values) else None,
+        'max': float(values.max()) if len(values) else None,
+    }
+
+
+def build_reference_profile(df: pd.DataFrame, probabilities=None,
+                            n_bins: int = 10,
+                            max_categories: int = 50) -> dict:
+    """
+    Build the reference profile used by DriftMonitor from the training data:
+    - Quantile-binned histograms for numerical features
+    - Frequency tables for categorical features
+      (rare levels folded into __other__)
+    - Fixed-width histogram of predicted risk probabilities, if given
+    """
+    df = df.copy()
+    if 'Hour' not in df.columns and 'TransactionStartTime' in df.columns:
+        df['Hour'] = pd.to_datetime(df['TransactionStartTime']).dt.hour
+
+    profile = {'n_rows': int(len(df)), 'numeric': {}, 'categorical': {}}
+
+    for col in NUMERIC_FEATURES:
+        if col in df.columns:
+            edges = _quantile_edges(df[col].astype(float), n_bins)
+            profile['numeric'][col] = _numeric_profile(df[col], edges)
+
+    for col in CATEGORICAL_FEATURES:
+        if col in df.columns:
+            counts = df[col].astype(str).value_counts()
+            top = counts.iloc[:max_categories]
+            table = {str(k): int(v) for k, v in top.items()}
+            table[OTHER_CATEGORY] = int(counts.iloc[max_categories:].sum())
+            profile['categorical'][col] = table
+
+    if probabilities is not None:
+        profile['prediction'] = _numeric_profile(pd.Series(probabilities),
+                                                 PROBABILITY_EDGES)
+
+    return profile
+
+
+def save_reference_profile(profile: dict, filepath: str) -> None:
+    """
+    Save a reference profile to JSON.
+    """
+    with open(filepath, 'w') as f:
+        json.dump(profile, f, indent=2)
+
+
+def load_reference_profile(filepath: str) -> dict:
+    """
+    Load a reference profile from JSON.
+    """
+    with open(filepath, 'r') as f:
+        return json.load(f)
+
+
+def psi(expected: list, actual: list):
+    """
+    Population Stability Index between two histograms over the same bins.
+    Returns None if either histogram is empty.
+    """
+    expected_total = sum(expected)
+    actual_total = sum(actual)
+    if expected_total == 0 or actual_total == 0:
+        return None
+    value = 0.0
+    for e, a in zip(expected, actual):
+        e_pct = max(e / expected_total, EPSILON)
+        a_pct = max(a / actual_total, EPSILON)
+        value += (a_pct - e_pct) * math.log(a_pct / e_pct)
+    return value
+
+
+def ks_statistic(expected: list, actual: list):
+    """
+    Kolmogorov-Smirnov statistic between two histograms over the same bins.
+    Evaluated at the bin edges only, so it is a lower bound on the exact KS.
+    Returns None if either histogram is empty.
+    """
+    expected_total = sum(expected)
+    actual_total = sum(actual)
+    if expected_total == 0 or actual_total == 0:
+        return None
+    expected_cdf = actual_cdf = 0.0
+    value = 0.0
+    for e, a in zip(expected, actual):
+        expected_cdf += e / expected_total
+        actual_cdf += a / actual_total
+        value = max(value, abs(expected_cdf - actual_cdf))
+    return value
+
+
+def drift_status(psi_value) -> str:
+    """
+    Conventional PSI thresholds: < 0.1 stable, < 0.25 moderate,
+    otherwise significant.
+    """
+    if psi_value is None:
+        return INSUFFICIENT_DATA
+    if psi_value < 0.1:
+        return 'stable'
+    if psi_value < 0.25:
+        return 'moderate'
+    return 'significant'
+
+
+class _WindowedCounts:
+    """
+    Bin counts over a sliding window of recent observations.
+
+    The window is a ring of N_CHUNKS per-chunk snapshots of CHUNK_SIZE
+    observations; when a chunk fills up, the oldest one is dropped from the
+    window totals. Memory is bounded by n_bins * n_chunks and each
+    observation costs amortized O(1).
+    """
+
+    def __init__(self, n_bins: int, chunk_size: int = CHUNK_SIZE,
+                 n_chunks: int = N_CHUNKS):
+        self.n_bins = n_bins
+        self.chunk_size = chunk_size
+        self.chunks = deque(maxlen=n_chunks)
+        self.counts = [0] * n_bins
+        self.n = 0
+        self.chunks.append(self._empty_chunk())
+
+    def _empty_chunk(self) -> dict:
+        return {'counts': [0] * self.n_bins, 'n': 0}
+
+    def _evict(self, oldest: dict) -> None:
+        for i, c in enumerate(oldest['counts']):
+            self.counts[i] -= c
+        self.n -= oldest['n']
+
+    def _current_chunk(self) -> dict:
+        chunk = self.chunks[-1]
+        if chunk['n'] == self.chunk_size:
+            if len(self.chunks) == self.chunks.maxlen:
+                self._evict(self.chunks[0])
+            chunk = self._empty_chunk()
+            self.chunks.append(chunk)
+        return chunk
+
+    def add(self, index: int) -> None:
+        chunk = self._current_chunk()
+        chunk['counts'][index] += 1
+        chunk['n'] += 1
+        self.counts[index] += 1
+        self.n += 1
+
+
+class _NumericWindow(_WindowedCounts):
+    """
+    Windowed histogram over fixed bin edges, plus windowed mean/min/max.
+    """
+
+    def __init__(self, edges: list, **kwargs):
+        self.edges = list(edges)
+        self.total = 0.0
+        super().__init__(len(self.edges) + 1, **kwargs)
+
+    def _empty_chunk(self) -> dict:
+        return {**super()._empty_chunk(),
+                'total': 0.0, 'min': math.inf, 'max': -math.inf}
+
+    def _evict(self, oldest: dict) -> None:
+        super()._evict(oldest)
+        self.total -= oldest['total']
+
+    def add_value(self, value: float) -> None:
+        index = bisect_right(self.edges, value)
+        chunk = self._current_chunk()
+        self.add(index)
+        chunk['total'] += value
+        chunk['min'] = min(chunk['min'], value)
+        chunk['max'] = max(chunk['max'], value)
+        self.total += value
+
+    def summary(self) -> dict:
+        if not self.n:
+            return {'count': 0, 'mean': None, 'min': None, 'max': None}
+        return {
+            'count': self.n,
+            'mean': self.total / self.n,
+            'min': min(c['min'] for c in self.chunks if c['n']),
+            'max': max(c['max'] for c in self.chunks if c['n']),
+        }
+
+
+class DriftMonitor:
+    """
+    Streaming drift and data-quality monitor for live prediction traffic.
+
+    Memory is bounded by the reference profile and the window size (one
+    counter per bin or known category per chunk) and each observation costs
+    a constant amount of work, so it can run on every request. PSI/KS are
+    computed on demand over the recent window against the reference;
+    data-quality counters are cumulative.
+    """
+
+    def __init__(self, profile: dict, chunk_size: int = CHUNK_SIZE,
+                 n_chunks: int = N_CHUNKS, min_count: int = MIN_COUNT):
+        self.reference = profile
+        self.min_count = min_count
+        self.window_size = chunk_size * n_chunks
+        self._lock = threading.Lock()
+        window = {'chunk_size': chunk_size, 'n_chunks': n_chunks}
+        self._numeric = {
+            col: _NumericWindow(ref['edges'], **window)
+            for col, ref in profile['numeric'].items()
+        }
+        self._category_index = {
+            col: {k: i for i, k in enumerate(ref)}
+            for col, ref in profile['categorical'].items()
+        }
+        self._categorical = {
+            col: _WindowedCounts(len(index), **window)
+            for col, index in self._category_index.items()
+        }
+        prediction_ref = profile.get('prediction')
+        self._prediction = None
+        if prediction_ref:
+            self._prediction = _NumericWindow(prediction_ref['edges'],
+                                              **window)
+        self.n_requests = 0
+        self.quality = {
+            'invalid_timestamp': 0,
+            'missing': dict.fromkeys(
+                list(self._numeric) + list(self._categorical), 0),
+            'out_of_range': dict.fromkeys(self._numeric, 0),
+            'unseen_category': dict.fromkeys(self._categorical, 0),
+        }
+
+    @classmethod
+    def from_file(cls, filepath: str, **kwargs) -> 'DriftMonitor':
+        return cls(load_reference_profile(filepath), **kwargs)
+
+    def observe(self, features: dict) -> None:
+        """
+        Record one request's raw features. Missing or invalid values are
+        counted as data-quality issues instead of being added to the
+        histograms.
+        """
+        with self._lock:
+            self.n_requests += 1
+            for col, hist in self._numeric.items():
+                value = features.get(col)
+                try:
+                    value = float(value)
+                except (TypeError, ValueError):
+                    value = math.nan
+                if math.isnan(value):
+                    self.quality['missing'][col] += 1
+                    continue
+                ref = self.reference['numeric'][col]
+                if ref['min'] is not None and (
+                        value < ref['min'] or value > ref['max']):
+                    self.quality['out_of_range'][col] += 1
+                hist.add_value(value)
+
+            for col, hist in self._categorical.items():
+                value = features.get(col)
+                if value is None:
+                    self.quality['missing'][col] += 1
+                    continue
+                index = self._category_index[col]
+                value = str(value)
+                if value not in index:
+                    self.quality['unseen_category'][col] += 1
+                    value = OTHER_CATEGORY
+                hist.add(index[value])
+
+    def observe_invalid_timestamp(self) -> None:
+        with self._lock:
+            self.n_requests += 1
+            self.quality['invalid_timestamp'] += 1
+
+    def observe_prediction(self, probability: float) -> None:
+        if self._prediction is None:
+            return
+        with self._lock:
+            self._prediction.add_value(float(probability))
+
+    def _drift(self, ref_counts: list, hist: _WindowedCounts,
+               with_ks: bool = True) -> dict:
+        if hist.n < self.min_count:
+            psi_value = ks_value = None
+        else:
+            psi_value = psi(ref_counts, hist.counts)
+            ks_value = ks_statistic(ref_counts, hist.counts)
+        drift = {'psi': psi_value, 'status': drift_status(psi_value)}
+        if with_ks:
+            drift['ks'] = ks_value
+        return drift
+
+    def report(self) -> dict:
+        """
+        PSI/KS per feature and for the predicted risk probability over the
+        recent window, plus cumulative data-quality counters.
+        """
+        with self._lock:
+            features = {}
+            for col, hist in self._numeric.items():
+                ref_counts = self.reference['numeric'][col]['counts']
+                features[col] = {**self._drift(ref_counts, hist),
+                                 **hist.summary()}
+            for col, hist in self._categorical.items():
+                ref_counts = list(self.reference['categorical'][col].values())
+                features[col] = {
+                    **self._drift(ref_counts, hist, with_ks=False),
+                    'count': hist.n,
+                }
+
+            report = {
+                'n_requests': self.n_requests,
+                'window_size': self.window_size,
+                'features': features,
+                'data_quality': copy.deepcopy(self.quality),
+            }
+            if self._prediction is not None:
+                ref_counts = self.reference['prediction']['counts']
+                report[PREDICTION_NAME] = {
+                    **self._drift(ref_counts, self._prediction),
+                    **self._prediction.summary(),
+                }
+            return report
@@ -1,3 +1,5 @@
+import sys
+
 import pandas as pd
 import numpy as np
 import mlflow
@@ -8,6 +10,12 @@ from sklearn.linear_model import LogisticRegression
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, roc_auc_score
 
+from benchmark import (
+    benchmark_model, fit_with_profile, search_stage_times,
+    select_production_model,
+)
+from monitoring import build_reference_profile, save_reference_profile
+
 # ======================
 # Load data
 # ======================
@@ -50,8 +58,16 @@ models = {
 }
 
 # ======================
-# Train & log experiments
+# Promotion gates
+# ======================
+# A model is only promoted to `production` if single-row prediction
+# fits the serving budget
+LATENCY_BUDGET_MS = 50.0
+
+# ======================
+# Train, benchmark & log experiments
 # ======================
+results = {}
 for name, config in models.items():
     with mlflow.start_run(run_name=name):
         clf = GridSearchCV(
@@ -61,7 +77,7 @@ for name, config in models.items():
             scoring='roc_auc',
             n_jobs=-1
         )
-        clf.fit(X_train, y_train)
+        fit_stats = fit_with_profile(clf, X_train, y_train)
 
         y_pred = clf.predict(X_test)
         y_proba = clf.predict_proba(X_test)[:, 1]
@@ -72,24 +88,77 @@ for name, config in models.items():
         f1 = f1_score(y_test, y_pred)
         roc = roc_auc_score(y_test, y_proba)
 
+        # Per-stage timings and serving cost of the selected estimator
+        bench = benchmark_model(clf.best_estimator_, X_test)
+        bench['fit_total_seconds'] = fit_stats['fit_seconds']
+        bench['fit_memory_increase_mb'] = fit_stats['fit_memory_increase_mb']
+        bench['fit_peak_memory_mb'] = fit_stats['fit_peak_memory_mb']
+        bench.update(search_stage_times(clf))
+        within_budget = bench['predict_single_row_ms'] <= LATENCY_BUDGET_MS
+
         mlflow.log_params(clf.best_params_)
         mlflow.log_metric("accuracy", acc)
         mlflow.log_metric("precision", prec)
         mlflow.log_metric("recall", rec)
         mlflow.log_metric("f1_score", f1)
         mlflow.log_metric("roc_auc", roc)
+        mlflow.log_metrics(bench)
+        mlflow.set_tag("within_latency_budget", str(within_budget))
 
         # Save model
         mlflow.sklearn.log_model(clf.best_estimator_, "model")
 
+        results[name] = {
+            'estimator': clf.best_estimator_,
+            'roc_auc': roc,
+            'predict_single_row_ms': bench['predict_single_row_ms'],
+        }
+
         print(f"✅ {name} | Best params: {clf.best_params_} | AUC: {roc:.3f}")
+        print(f"   fit {bench['fit_total_seconds']:.2f}s"
+              f" (cv fit {bench['cv_fit_seconds']:.2f}s,"
+              f" cv score {bench['cv_score_seconds']:.2f}s,"
+              f" refit {bench['refit_seconds']:.2f}s)"
+              f" | fit memory +{bench['fit_memory_increase_mb']:.1f} MB"
+              f" | predict 1 row {bench['predict_single_row_ms']:.2f} ms,"
+              f" 1k rows {bench['predict_batch_1000_ms']:.2f} ms"
+              f" | size {bench['model_size_bytes'] / 1024:.0f} KB")
 
 print("✅ Training & tracking done.")
 
-import mlflow
+# ======================
+# Promote the best model within the latency budget
+# ======================
 mlflow.set_tracking_uri("file:/app/mlruns")
-# ... your model training code ...
-mlflow.sklearn.log_model(clf.best_estimator_, "model", registered_model_name="credit_scoring_model")
 client = mlflow.tracking.MlflowClient()
-latest = client.get_latest_versions("credit_scoring_model", stages=["None"])[0]
-client.set_registered_model_alias("credit_scoring_model", "production", latest.version)
\ No newline at end of file
+
+best_name = select_production_model(results, LATENCY_BUDGET_MS)
+if best_name is None:
+    try:
+        client.get_model_version_by_alias("credit_scoring_model", "production")
+    except mlflow.exceptions.MlflowException:
+        # Without a production alias the API cannot load a model at startup
+        sys.exit(f"❌ No model meets the {LATENCY_BUDGET_MS} ms latency budget"
+                 " and no production model exists.")
+    print(f"⚠️ No model meets the {LATENCY_BUDGET_MS} ms latency budget;"
+          " production alias left unchanged.")
+else:
+    best_model = results[best_name]['estimator']
+
+    mlflow.sklearn.log_model(best_model, "model",
+                             registered_model_name="credit_scoring_model")
+    latest = client.get_latest_versions("credit_scoring_model",
+                                        stages=["None"])[0]
+    client.set_registered_model_alias("credit_scoring_model", "production",
+                                      latest.version)
+    print(f"✅ Promoted {best_name}"
+          f" (AUC: {results[best_name]['roc_auc']:.3f}) to production.")
+
+    # ======================
+    # Reference profile for drift monitoring (API's /monitoring/drift)
+    # ======================
+    clean_df = pd.read_csv('data/processed/credit_data_clean.csv')
+    probabilities = best_model.predict_proba(X_test)[:, 1]
+    profile = build_reference_profile(clean_df, probabilities)
+    save_reference_profile(profile, 'data/processed/reference_profile.json')
+    print("✅ Reference profile saved for drift monitoring.")
@@ -0,0 +1,95 @@
+# tests/test_benchmark.py
+
+import pickle
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.benchmark import (
+    benchmark_model, fit_with_profile, search_stage_times,
+    select_production_model,
+)
+
+
+class MeanClassifier:
+    def __init__(self, fit_delay: float = 0.0):
+        self.fit_delay = fit_delay
+        self.fit_calls = 0
+        self.batch_sizes = []
+
+    def fit(self, X, y):
+        time.sleep(self.fit_delay)
+        self.fit_calls += 1
+        self.weights_ = np.ones(X.shape[1]) * float(np.mean(y))
+        return self
+
+    def predict_proba(self, X):
+        self.batch_sizes.append(len(X))
+        p = np.clip(X.to_numpy() @ self.weights_, 0, 1)
+        return np.column_stack([1 - p, p])
+
+
+class FakeSearch:
+    n_splits_ = 3
+    refit_time_ = 0.5
+    cv_results_ = {'mean_fit_time': np.array([1.0, 2.0]),
+                   'mean_score_time': np.array([0.1, 0.2])}
+
+
+def test_fit_with_profile_fits_and_reports_time_and_memory():
+    X = pd.DataFrame({'a': np.arange(100.0), 'b': np.ones(100)})
+    y = pd.Series([0, 1] * 50)
+    model = MeanClassifier(fit_delay=0.1)
+    stats = fit_with_profile(model, X, y)
+    assert model.fit_calls == 1
+    assert stats['fit_seconds'] >= 0.1
+    assert stats['fit_peak_memory_mb'] > 0
+
+
+class AllocatingClassifier:
+    def fit(self, X, y):
+        self.buffer_ = np.ones(100 * 1024 ** 2 // 8)  # 100 MB, pages touched
+        return self
+
+
+def test_fit_with_profile_reports_memory_above_baseline():
+    X = pd.DataFrame({'a': np.arange(10.0)})
+    stats = fit_with_profile(AllocatingClassifier(), X, [0, 1] * 5)
+    assert 80 <= stats['fit_memory_increase_mb'] <= 150
+    assert stats['fit_peak_memory_mb'] >= stats['fit_memory_increase_mb']
+
+
+def test_search_stage_times_from_cv_results():
+    times = search_stage_times(FakeSearch())
+    assert times['cv_fit_seconds'] == 9.0
+    assert times['cv_score_seconds'] == pytest.approx(0.9)
+    assert times['refit_seconds'] == 0.5
+
+
+def test_benchmark_model_resamples_small_inputs_to_batch_size():
+    X = pd.DataFrame({'a': np.random.rand(10), 'b': np.random.rand(10)})
+    model = MeanClassifier().fit(X, [0, 1] * 5)
+    bench = benchmark_model(model, X, batch_size=1000, repeats=3)
+    assert set(bench) == {'predict_single_row_ms', 'predict_batch_1000_ms',
+                          'model_size_bytes'}
+    # warm-up + repeats for a single row, then for the batch
+    assert model.batch_sizes == [1] * 4 + [1000] * 4
+    assert bench['model_size_bytes'] == len(pickle.dumps(model))
+
+
+def test_select_production_model_picks_best_auc_within_budget():
+    results = {
+        'fast': {'roc_auc': 0.80, 'predict_single_row_ms': 2.0},
+        'slow_but_better': {'roc_auc': 0.95, 'predict_single_row_ms': 80.0},
+        'fast_and_good': {'roc_auc': 0.85, 'predict_single_row_ms': 10.0},
+    }
+    assert select_production_model(results, 50.0) == 'fast_and_good'
+    assert select_production_model(results, 100.0) == 'slow_but_better'
+
+
+def test_select_production_model_none_eligible():
+    results = {'slow': {'roc_auc': 0.95, 'predict_single_row_ms': 80.0}}
+    assert select_production_model(results, latency_budget_ms=50.0) is None
+    assert select_production_model({}, latency_budget_ms=50.0) is None
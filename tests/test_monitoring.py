@@ -0,0 +1,126 @@
+# tests/test_monitoring.py
+
+import pandas as pd
+import pytest
+
+from src.monitoring import (
+    DriftMonitor, build_reference_profile, psi, ks_statistic
+)
+
+
+@pytest.fixture
+def reference_df():
+    return pd.DataFrame({
+        'Amount': [float(i) for i in range(100)],
+        'Value': list(range(100)),
+        'PricingStrategy': [2] * 100,
+        'TransactionStartTime': ['2018-11-15T04:00:00Z'] * 100,
+        'ProductCategory': ['airtime'] * 60 + ['financial_services'] * 40,
+        'ChannelId': ['ChannelId_3'] * 100,
+    })
+
+
+def test_psi_and_ks_identical_histograms():
+    assert psi([10, 20, 30], [1, 2, 3]) == pytest.approx(0.0)
+    assert ks_statistic([10, 20, 30], [1, 2, 3]) == pytest.approx(0.0)
+
+
+def test_ks_fully_shifted_histograms():
+    assert ks_statistic([10, 0], [0, 10]) == pytest.approx(1.0)
+
+
+def test_monitor_stable_on_reference_like_traffic(reference_df):
+    probabilities = [0.1] * 50 + [0.9] * 50
+    profile = build_reference_profile(reference_df, probabilities)
+    monitor = DriftMonitor(profile)
+
+    for _, row in reference_df.iterrows():
+        monitor.observe({**row.to_dict(), 'Hour': 4})
+    for p in [0.1] * 50 + [0.9] * 50:
+        monitor.observe_prediction(p)
+
+    report = monitor.report()
+    assert report['n_requests'] == 100
+    assert report['features']['Amount']['psi'] == pytest.approx(0.0)
+    assert report['features']['ProductCategory']['status'] == 'stable'
+    assert report['risk_probability']['ks'] == pytest.approx(0.0)
+
+
+def test_monitor_flags_drift_and_data_quality(reference_df):
+    monitor = DriftMonitor(build_reference_profile(reference_df), min_count=10)
+
+    for _ in range(50):
+        monitor.observe({'Amount': 1000.0, 'Value': None,
+                         'PricingStrategy': 2, 'Hour': 4,
+                         'ProductCategory': 'tv',
+                         'ChannelId': 'ChannelId_3'})
+    monitor.observe_invalid_timestamp()
+
+    report = monitor.report()
+    assert report['features']['Amount']['status'] == 'significant'
+    assert report['features']['Amount']['ks'] > 0.5
+    assert report['data_quality']['out_of_range']['Amount'] == 50
+    assert report['data_quality']['missing']['Value'] == 50
+    assert report['data_quality']['unseen_category']['ProductCategory'] == 50
+    assert report['data_quality']['invalid_timestamp'] == 1
+
+
+def test_monitor_flags_shift_after_long_stable_period(reference_df):
+    monitor = DriftMonitor(build_reference_profile(reference_df),
+                           chunk_size=100, n_chunks=10)
+    rows = [{**row.to_dict(), 'Hour': 4} for _, row in reference_df.iterrows()]
+
+    for _ in range(200):
+        for row in rows:
+            monitor.observe(row)
+    assert monitor.report()['features']['Amount']['status'] == 'stable'
+
+    for _ in range(1000):
+        monitor.observe({**rows[0], 'Amount': 1000.0})
+
+    report = monitor.report()
+    assert report['features']['Amount']['count'] == 1000
+    assert report['features']['Amount']['status'] == 'significant'
+    assert report['data_quality']['out_of_range']['Amount'] == 1000
+
+
+def test_monitor_reports_insufficient_data(reference_df):
+    profile = build_reference_profile(reference_df, [0.5] * 100)
+    monitor = DriftMonitor(profile)
+    for _ in range(5):
+        monitor.observe({'Amount': None, 'ProductCategory': 'airtime'})
+
+    report = monitor.report()
+    for col in ['Amount', 'Value', 'ProductCategory']:
+        assert report['features'][col]['psi'] is None
+        assert report['features'][col]['status'] == 'insufficient_data'
+    assert report['features']['Amount']['ks'] is None
+    assert report['features']['Amount']['count'] == 0
+    assert report['risk_probability']['status'] == 'insufficient_data'
+
+
+def test_reference_profile_with_all_missing_column(reference_df):
+    reference_df['Value'] = float('nan')
+    profile = build_reference_profile(reference_df)
+    assert profile['numeric']['Value']['min'] is None
+    assert sum(profile['numeric']['Value']['counts']) == 0
+
+    monitor = DriftMonitor(profile, min_count=1)
+    monitor.observe({'Amount': 1.0, 'Value': 5, 'Hour': 4})
+    report = monitor.report()
+    assert report['data_quality']['out_of_range']['Value'] == 0
+    assert report['features']['Value']['status'] == 'insufficient_data'
+
+
+def test_window_drops_old_values_and_categories_only_count(reference_df):
+    monitor = DriftMonitor(build_reference_profile(reference_df),
+                           chunk_size=10, n_chunks=2, min_count=1)
+    for value in [500.0] * 10 + [1.0] * 20:
+        monitor.observe({'Amount': value, 'ProductCategory': 'airtime'})
+
+    amount = monitor.report()['features']['Amount']
+    assert (amount['count'], amount['mean'], amount['max']) == (20, 1.0, 1.0)
+
+    categories = monitor.report()['features']['ProductCategory']
+    assert set(categories) == {'psi', 'status', 'count'}
+    assert categories['count'] == 20